@@ -11,6 +11,7 @@ with different model weights, tools, and parameters.
 
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 from dotenv import load_dotenv
 from transformers import logging
@@ -30,6 +31,11 @@ logging.set_verbosity_error()
 # Load environment variables from .env file
 _ = load_dotenv()
 
+# Caches so repeated initialize_agent calls (e.g. hot reloads) reuse already
+# loaded tools and language models instead of reloading multi-GB weights
+_TOOL_CACHE: Dict[Tuple, Any] = {}
+_LLM_CACHE: Dict[Tuple, ChatOpenAI] = {}
+
 
 def initialize_agent(
     prompt_file: str,
@@ -68,7 +74,9 @@ def initialize_agent(
     all_tools: Dict[str, callable] = {
         "ChestXRayClassifierTool": lambda: ChestXRayClassifierTool(device=device),
         "ChestXRaySegmentationTool": lambda: ChestXRaySegmentationTool(device=device),
-        "LlavaMedTool": lambda: LlavaMedTool(cache_dir=model_dir, device=device, load_in_8bit=True),
+        "LlavaMedTool": lambda: LlavaMedTool(
+            cache_dir=model_dir, device=device, quantization="4bit"
+        ),
         "XRayVQATool": lambda: XRayVQATool(cache_dir=model_dir, device=device),
         "ChestXRayReportGeneratorTool": lambda: ChestXRayReportGeneratorTool(
             cache_dir=model_dir, device=device
@@ -81,21 +89,45 @@ def initialize_agent(
         ),
         "ImageVisualizerTool": lambda: ImageVisualizerTool(),
         "DicomProcessorTool": lambda: DicomProcessorTool(temp_dir=temp_dir),
+        "NiftiProcessorTool": lambda: NiftiProcessorTool(temp_dir=temp_dir),
         "MedicalRAGTool": lambda: RAGTool(config=rag_config),
     }
 
     # Initialize only selected tools or all if none specified
-    tools_dict: Dict[str, BaseTool] = {}
     tools_to_use = tools_to_use or all_tools.keys()
-    for tool_name in tools_to_use:
-        if tool_name in all_tools:
-            tools_dict[tool_name] = all_tools[tool_name]()
+    selected_tools = [name for name in tools_to_use if name in all_tools]
+
+    # The cache key must cover every input the tool constructors read, so a
+    # changed temp_dir or RAG configuration cannot return a stale instance
+    config_key = (device, model_dir, temp_dir, repr(rag_config))
+
+    # Construct uncached tools concurrently; their load time is dominated by
+    # blocking I/O (weight downloads, torch.load, CUDA init) that releases the
+    # GIL, so startup cost drops from the sum of loads to the slowest load
+    uncached_tools = [
+        name for name in selected_tools if (name, *config_key) not in _TOOL_CACHE
+    ]
+    if uncached_tools:
+        with ThreadPoolExecutor(max_workers=len(uncached_tools)) as executor:
+            futures = {name: executor.submit(all_tools[name]) for name in uncached_tools}
+            for name, future in futures.items():
+                _TOOL_CACHE[(name, *config_key)] = future.result()
+
+    tools_dict: Dict[str, BaseTool] = {
+        name: _TOOL_CACHE[(name, *config_key)] for name in selected_tools
+    }
 
     # Set up checkpointing for conversation state
     checkpointer = MemorySaver()
 
-    # Initialize the language model
-    model = ChatOpenAI(model=model, temperature=temperature, top_p=top_p, **openai_kwargs)
+    # Initialize the language model, reusing a cached instance when possible;
+    # openai_kwargs is part of the key so a new api_key or base_url is honored
+    llm_key = (model, temperature, top_p, tuple(sorted(openai_kwargs.items())))
+    if llm_key not in _LLM_CACHE:
+        _LLM_CACHE[llm_key] = ChatOpenAI(
+            model=model, temperature=temperature, top_p=top_p, **openai_kwargs
+        )
+    model = _LLM_CACHE[llm_key]
 
     # Create the agent with the specified model, tools, and configuration
     agent = Agent(
@@ -124,6 +156,7 @@ if __name__ == "__main__":
     tools_to_use = [
         "ImageVisualizerTool",  # For displaying images in the UI
         "DicomProcessorTool",  # For processing DICOM medical image files
+        "NiftiProcessorTool",  # For processing NIfTI medical image files
         "ChestXRayClassifierTool",  # For classifying chest X-ray images
         "ChestXRaySegmentationTool",  # For segmenting anatomical regions in chest X-rays
         "ChestXRayReportGeneratorTool",  # For generating medical reports from X-rays
@@ -143,6 +176,8 @@ if __name__ == "__main__":
         chunk_size=1000,
         chunk_overlap=100,
         retriever_k=3,
+        precision="float32",  # Use "int8" for a fresh index: 4x smaller, near-identical quality
+        rescore_multiplier=4,  # Oversampling factor before reranking when quantized
         local_docs_dir="medrax/rag/docs",  # Change this to the path of the documents for RAG
         use_medrag_textbooks=False,  # Set to True if you want to use the MedRAG textbooks dataset
     )
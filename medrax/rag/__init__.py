@@ -1,3 +1,3 @@
-from .rag import RAGConfig, RerankingRetriever, CohereRAG
+from .rag import RAGConfig, LSHCache, RerankingRetriever, CohereRAG
 
-__all__ = ["RAGConfig", "RerankingRetriever", "CohereRAG"]
+__all__ = ["RAGConfig", "LSHCache", "RerankingRetriever", "CohereRAG"]
@@ -1,6 +1,8 @@
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any, Tuple
+import numpy as np
 from pydantic import Field
 
 from pydantic import BaseModel, Field
@@ -31,6 +33,11 @@ class RAGConfig(BaseModel):
         chunk_overlap (int): Overlap between text chunks
         local_docs_dir (str): Directory for text files
         use_medrag_textbooks (bool): Whether to use MedRAG textbooks dataset
+        precision (str): Embedding precision ("float32" or "int8"); int8
+            embeddings shrink freshly built indexes 4x with little quality
+            loss, and must match the precision the index was built with
+        rescore_multiplier (int): Candidate oversampling factor used with
+            quantized embeddings before reranking recovers full-precision order
     """
 
     model: str = Field(default="command-a-03-2025")
@@ -38,6 +45,8 @@ class RAGConfig(BaseModel):
     persist_dir: str = Field(default="vector_database")
     embedding_model: str = Field(default="embed-english-v3.0")
     rerank_model: str = Field(default="rerank-v3.5")
+    precision: Literal["float32", "int8"] = Field(default="float32")
+    rescore_multiplier: int = Field(default=4, ge=1)
     retriever_k: int = Field(default=2)
     chunk_size: int = Field(default=1000)
     chunk_overlap: int = Field(default=200)
@@ -45,6 +54,111 @@ class RAGConfig(BaseModel):
     use_medrag_textbooks: bool = Field(default=True)
 
 
+class LSHCache:
+    """Semantic cache for retrieval results using random-projection LSH.
+
+    Query embeddings are hashed into bit-string buckets across several
+    sign-projection tables; a lookup returns a cached result when a bucketed
+    candidate's cosine similarity to the new query clears the threshold.
+    Entries are evicted least-recently-used once max_entries is reached.
+
+    Attributes:
+        n_tables (int): Number of independent hash tables
+        n_bits (int): Bits per hash signature
+        threshold (float): Minimum cosine similarity for a cache hit
+        max_entries (int): Maximum number of cached queries
+    """
+
+    def __init__(
+        self,
+        n_tables: int = 8,
+        n_bits: int = 16,
+        threshold: float = 0.95,
+        max_entries: int = 10_000,
+        seed: int = 0,
+    ):
+        """Initialize the cache; projection planes are built lazily once the
+        embedding dimensionality is known."""
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._rng = np.random.default_rng(seed)
+        self._planes: Optional[np.ndarray] = None
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, Any, List[Tuple[int, int]]]]" = (
+            OrderedDict()
+        )
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._next_id = 0
+
+    def _signatures(self, vector: np.ndarray) -> List[Tuple[int, int]]:
+        """Hash a unit vector to one (table, bit-string) signature per table."""
+        if self._planes is None:
+            # Sign projections stored as int8: +/-1 entries are all LSH needs
+            self._planes = self._rng.choice(
+                (-1, 1), size=(self.n_tables, self.n_bits, len(vector))
+            ).astype(np.int8)
+        bits = (self._planes @ vector) > 0
+        return [
+            (table, int.from_bytes(np.packbits(bits[table]).tobytes(), "big"))
+            for table in range(self.n_tables)
+        ]
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def get(self, embedding: np.ndarray) -> Optional[Any]:
+        """Return the cached value for the closest stored query, or None.
+
+        Args:
+            embedding (np.ndarray): Query embedding to look up
+
+        Returns:
+            Optional[Any]: Cached value if a candidate clears the threshold
+        """
+        vector = self._normalize(np.asarray(embedding, dtype=np.float32))
+        candidates = set()
+        for signature in self._signatures(vector):
+            candidates.update(self._buckets.get(signature, ()))
+
+        best_id, best_cosine = None, self.threshold
+        for entry_id in candidates:
+            cosine = float(self._entries[entry_id][0] @ vector)
+            if cosine >= best_cosine:
+                best_id, best_cosine = entry_id, cosine
+
+        if best_id is None:
+            return None
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][1]
+
+    def put(self, embedding: np.ndarray, value: Any) -> None:
+        """Cache a value under a query embedding, evicting LRU entries.
+
+        Args:
+            embedding (np.ndarray): Query embedding to key the value under
+            value (Any): Result to return for future similar queries
+        """
+        vector = self._normalize(np.asarray(embedding, dtype=np.float32))
+        entry_id = self._next_id
+        self._next_id += 1
+        signatures = self._signatures(vector)
+        self._entries[entry_id] = (vector, value, signatures)
+        for signature in signatures:
+            self._buckets.setdefault(signature, []).append(entry_id)
+        while len(self._entries) > self.max_entries:
+            evicted_id, (_, _, evicted_signatures) = self._entries.popitem(last=False)
+            # Prune the evicted id from its buckets so neither the bucket
+            # index nor the candidate scans grow without bound
+            for signature in evicted_signatures:
+                bucket = self._buckets[signature]
+                bucket.remove(evicted_id)
+                if not bucket:
+                    del self._buckets[signature]
+
+
 class RerankingRetriever(BaseRetriever):
     """Custom retriever that wraps a document retrieval function with reranking.
 
@@ -86,16 +200,25 @@ class CohereRAG:
         memory (ConversationBufferMemory): Conversation memory
         vectorstore (Optional[Chroma]): Vector database for document storage
         local_docs_dir (str): Directory for text files
+        query_cache (LSHCache): Semantic cache of reranked retrieval results
     """
 
     def __init__(self, config: RAGConfig = RAGConfig()):
         """Initialize RAG system with given configuration."""
         self.config = config
         self.chat_model = ChatCohere(model=config.model, temperature=config.temperature)
-        self.embeddings = CohereEmbeddings(model=config.embedding_model)
+
+        # Request quantized embeddings straight from the Cohere embed API;
+        # int8 gives a 4x smaller index, with reranking below recovering most
+        # of the retrieval quality
+        embedding_type = {"float32": "float", "int8": "int8"}[config.precision]
+        self.embeddings = CohereEmbeddings(
+            model=config.embedding_model, embedding_types=[embedding_type]
+        )
         self.reranker = CohereRerank(model=config.rerank_model)
         self.persist_dir = config.persist_dir
         self.local_docs_dir = config.local_docs_dir
+        self.query_cache = LSHCache()
         self.memory = ConversationBufferMemory(
             memory_key="chat_history",
             output_key="result",
@@ -197,7 +320,24 @@ class CohereRAG:
         """
         if os.path.exists(self.persist_dir):
             print("Loading existing vectorstore...")
-            return Chroma(persist_directory=self.persist_dir, embedding_function=self.embeddings)
+            vectorstore = Chroma(
+                persist_directory=self.persist_dir, embedding_function=self.embeddings
+            )
+            # Refuse to search with a different precision than the index was
+            # built with; mixing quantized queries into a float index (or vice
+            # versa) silently destroys retrieval quality. Indexes created
+            # before the precision was recorded hold float32 vectors.
+            stored_precision = (vectorstore._collection.metadata or {}).get(
+                "embedding_precision", "float32"
+            )
+            if stored_precision != self.config.precision:
+                raise ValueError(
+                    f"Vectorstore at {self.persist_dir} was built with "
+                    f"{stored_precision} embeddings but precision="
+                    f"{self.config.precision} was requested; rebuild the index "
+                    "or set the matching precision."
+                )
+            return vectorstore
         return None
 
     def create_or_update_vectorstore(self, documents: List[Document]):
@@ -212,6 +352,7 @@ class CohereRAG:
                 documents=documents,
                 embedding=self.embeddings,
                 persist_directory=self.persist_dir,
+                collection_metadata={"embedding_precision": self.config.precision},
             )
         else:
             print("Adding documents to existing vectorstore...")
@@ -228,14 +369,30 @@ class CohereRAG:
         Returns:
             List[Document]: Reranked relevant documents
         """
-        # Get initial candidates using vector similarity
-        docs = self.vectorstore.similarity_search(query, k=self.config.retriever_k * 2)
+        # Serve semantically repeated queries from the LSH cache, skipping the
+        # vector search and rerank calls entirely
+        query_embedding = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        cached_docs = self.query_cache.get(query_embedding)
+        if cached_docs is not None:
+            return cached_docs
+
+        # Get initial candidates using vector similarity, oversampling when the
+        # index stores quantized embeddings so reranking can recover the order
+        if self.config.precision != "float32":
+            oversample = max(self.config.rescore_multiplier, 2)
+        else:
+            oversample = 2
+        docs = self.vectorstore.similarity_search_by_vector(
+            query_embedding.tolist(), k=self.config.retriever_k * oversample
+        )
 
         # Rerank documents
         reranked = self.reranker.rerank(query=query, documents=[doc.page_content for doc in docs])
 
         # Return top k documents after reranking
-        return [docs[result["index"]] for result in reranked[: self.config.retriever_k]]
+        top_docs = [docs[result["index"]] for result in reranked[: self.config.retriever_k]]
+        self.query_cache.put(query_embedding, top_docs)
+        return top_docs
 
     def initialize_rag(self, with_memory: bool = False) -> RetrievalQA:
         """Initialize RAG chain with optional conversation memory.
@@ -8,5 +8,6 @@ from .llava_med import *
 from .grounding import *
 from .generation import *
 from .dicom import *
+from .nifti2image import *
 from .utils import *
 from .rag import *
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, Literal, Optional, Tuple, Type
 from pydantic import BaseModel, Field
 
 import torch
@@ -60,17 +60,25 @@ class LlavaMedTool(BaseTool):
         low_cpu_mem_usage: bool = True,
         torch_dtype: torch.dtype = torch.bfloat16,
         device: str = "cuda",
-        load_in_4bit: bool = False,
-        load_in_8bit: bool = False,
+        quantization: Literal["8bit", "4bit", "fp16"] = "4bit",
         **kwargs,
     ):
         super().__init__()
+        # Map the legacy boolean flags still used by older call sites onto the
+        # quantization parameter so they do not collide in load_pretrained_model
+        if kwargs.pop("load_in_8bit", False):
+            quantization = "8bit"
+        if kwargs.pop("load_in_4bit", False):
+            quantization = "4bit"
+
+        # 4-bit NF4 (configured in load_pretrained_model) halves weight memory
+        # versus 8-bit and avoids bitsandbytes' slow int8 dequant at batch size 1
         self.tokenizer, self.model, self.image_processor, self.context_len = load_pretrained_model(
             model_path=model_path,
             model_base=None,
             model_name=model_path,
-            load_in_4bit=load_in_4bit,
-            load_in_8bit=load_in_8bit,
+            load_in_4bit=quantization == "4bit",
+            load_in_8bit=quantization == "8bit",
             cache_dir=cache_dir,
             low_cpu_mem_usage=low_cpu_mem_usage,
             torch_dtype=torch_dtype,